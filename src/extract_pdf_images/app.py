@@ -8,7 +8,11 @@ Uses PyMuPDF (fitz) and PySide6 (Qt) for reliable cross-platform support.
 import sys
 import os
 import io
+import importlib
 import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -28,8 +32,21 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QListWidgetItem,
     QFrame,
+    QButtonGroup,
+    QProgressBar,
+)
+from PySide6.QtCore import (
+    Qt,
+    QSize,
+    QEvent,
+    QTimer,
+    Signal,
+    QMimeData,
+    QUrl,
+    QByteArray,
+    QBuffer,
+    QIODevice,
 )
-from PySide6.QtCore import Qt, QSize, QMimeData, QUrl, QByteArray, QBuffer, QIODevice
 from PySide6.QtGui import (
     QPixmap,
     QImage,
@@ -37,11 +54,73 @@ from PySide6.QtGui import (
     QPen,
     QColor,
     QDrag,
+    QIcon,
     QKeySequence,
     QShortcut,
 )
-import fitz  # PyMuPDF
-from PIL import Image
+
+# PyMuPDF and Pillow are slow to import: they are only loaded when the first
+# document is opened (see import_pdf_modules), so that the window shows up fast
+fitz = None  # PyMuPDF
+Image = None  # PIL.Image
+
+
+def import_pdf_modules():
+    """Import PyMuPDF and Pillow on first use"""
+    global fitz, Image
+    if fitz is None:
+        fitz = importlib.import_module("fitz")
+        Image = importlib.import_module("PIL.Image")
+
+
+def open_document(path):
+    """Open a PDF document for rendering"""
+    doc = fitz.open(path)
+    # Broken structure trees can make MuPDF spend minutes rendering a single
+    # page; tagged-PDF semantics are never used here, so the tree is dropped
+    try:
+        doc.xref_set_key(doc.pdf_catalog(), "StructTreeRoot", "null")
+    except Exception:
+        pass
+    return doc
+
+
+# Pixels per PDF point when the page is displayed at 100% zoom
+PAGE_RENDER_SCALE = 2.0
+
+# Width in pixels of page thumbnails; pages are rasterized at exactly this width
+THUMBNAIL_WIDTH = 150
+
+# Delay (ms) without scrolling before the visible thumbnails are rendered
+THUMBNAIL_RENDER_DELAY = 50
+
+# Maximum number of rendered thumbnails kept in memory
+THUMBNAIL_CACHE_SIZE = 64
+
+# Documents without a table of contents and with more pages than this are
+# listed in the outline by ranges of pages
+OUTLINE_PAGE_GROUP_SIZE = 100
+
+# Delays (ms) during which further page changes or zoom steps are coalesced
+# into a single render
+NAVIGATION_RENDER_DELAY = 50
+ZOOM_RENDER_DELAY = 120
+
+# Number of threads used to save images with Extract All
+EXTRACT_WORKERS = 4
+
+# Maximum number of pixels of rendered pages kept in memory (about 128 MB);
+# bounded by size rather than count since a page at 400% is 30M pixels
+PAGE_CACHE_PIXELS = 32 * 1024 * 1024
+
+# Maximum number of extracted embedded images (and of their previews) kept in memory
+IMAGE_CACHE_SIZE = 32
+
+# File extensions equivalent to the "jpeg" extension reported by PyMuPDF
+JPEG_EXTENSIONS = {"jpg": "jpeg", "jpe": "jpeg"}
+
+# Maximum width and height of the hover preview
+PREVIEW_MAX_SIZE = 400
 
 
 class DraggableListWidget(QListWidget):
@@ -55,17 +134,15 @@ class DraggableListWidget(QListWidget):
 
     def leaveEvent(self, event):
         """Close preview popup when mouse leaves the list"""
-        if self.parent_app and self.parent_app.preview_popup:
-            self.parent_app.preview_popup.close()
-            self.parent_app.preview_popup = None
+        if self.parent_app:
+            self.parent_app.preview_popup.hide()
         super().leaveEvent(event)
 
     def startDrag(self, supportedActions):
         """Handle drag start to export image file"""
         # Close preview popup when starting drag
-        if self.parent_app and self.parent_app.preview_popup:
-            self.parent_app.preview_popup.close()
-            self.parent_app.preview_popup = None
+        if self.parent_app:
+            self.parent_app.preview_popup.hide()
 
         if not self.parent_app or not self.currentItem():
             return
@@ -77,18 +154,14 @@ class DraggableListWidget(QListWidget):
 
         try:
             img_data = self.parent_app.images_data[index]
-            xref = img_data["xref"]
+            xref = img_data.xref
 
             # Extract the image
-            base_image = self.parent_app.pdf_doc.extract_image(xref)
-            image_bytes = base_image["image"]
-
-            # Convert to PIL Image then save to temp file
-            pil_image = Image.open(io.BytesIO(image_bytes))
+            pil_image = self.parent_app.load_image(xref)
 
             # Create temp file
             filename = (
-                f'page{self.parent_app.current_page+1}_image{img_data["index"]+1}.png'
+                f"page{self.parent_app.displayed_page+1}_image{img_data.index+1}.png"
             )
             temp_dir = tempfile.gettempdir()
             temp_path = os.path.join(temp_dir, filename)
@@ -112,7 +185,7 @@ class DraggableListWidget(QListWidget):
 class ImagePreviewPopup(QWidget):
     """Popup window to show image preview"""
 
-    def __init__(self, parent, pil_image, title="Image Preview"):
+    def __init__(self, parent):
         super().__init__(
             parent, Qt.ToolTip | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
         )
@@ -124,56 +197,176 @@ class ImagePreviewPopup(QWidget):
         layout.setContentsMargins(5, 5, 5, 5)
 
         # Title
-        title_label = QLabel(title)
-        title_label.setStyleSheet("font-weight: bold; border: none;")
-        layout.addWidget(title_label, alignment=Qt.AlignCenter)
+        self.title_label = QLabel()
+        self.title_label.setStyleSheet("font-weight: bold; border: none;")
+        layout.addWidget(self.title_label, alignment=Qt.AlignCenter)
 
         # Image
-        max_size = 400
-        img_width, img_height = pil_image.size
-        if img_width > max_size or img_height > max_size:
-            ratio = min(max_size / img_width, max_size / img_height)
-            new_width = int(img_width * ratio)
-            new_height = int(img_height * ratio)
-            pil_image = pil_image.resize(
-                (new_width, new_height), Image.Resampling.LANCZOS
-            )
-            img_width, img_height = new_width, new_height
-
-        # Convert PIL to QPixmap
-        img_byte_arr = io.BytesIO()
-        pil_image.save(img_byte_arr, format="PNG")
-        img_byte_arr = img_byte_arr.getvalue()
-
-        qimage = QImage.fromData(img_byte_arr)
-        pixmap = QPixmap.fromImage(qimage)
-
-        img_label = QLabel()
-        img_label.setPixmap(pixmap)
-        img_label.setStyleSheet("border: none;")
-        layout.addWidget(img_label, alignment=Qt.AlignCenter)
+        self.img_label = QLabel()
+        self.img_label.setStyleSheet("border: none;")
+        layout.addWidget(self.img_label, alignment=Qt.AlignCenter)
 
         # Size info
-        size_label = QLabel(f"{img_width}×{img_height} pixels")
-        size_label.setStyleSheet("font-size: 9px; border: none;")
-        layout.addWidget(size_label, alignment=Qt.AlignCenter)
+        self.size_label = QLabel()
+        self.size_label.setStyleSheet("font-size: 9px; border: none;")
+        layout.addWidget(self.size_label, alignment=Qt.AlignCenter)
 
         self.setLayout(layout)
+
+    def set_image(self, pixmap, title="Image Preview"):
+        """Update the popup content; the window itself is reused across hovers"""
+        self.title_label.setText(title)
+        self.img_label.setPixmap(pixmap)
+        self.size_label.setText(f"{pixmap.width()}×{pixmap.height()} pixels")
         self.adjustSize()
 
 
+def write_image(base_image, base_path):
+    """Write an extracted image as stored in the PDF, without re-encoding"""
+    with open(f"{base_path}.{base_image['ext']}", "wb") as f:
+        f.write(base_image["image"])
+
+
+@dataclass(slots=True)
+class ImagePlacement:
+    """An image drawn on a page, with its bounding box in PDF units"""
+
+    index: int
+    xref: int
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+    @property
+    def width(self):
+        return self.x1 - self.x0
+
+    @property
+    def height(self):
+        return self.y1 - self.y0
+
+
+def list_page_images(page):
+    """Return the image placements of a page, which do not depend on zoom"""
+    images_data = []
+
+    # Text-only pages are common: looking at the page resources is enough to
+    # skip the content stream walk below
+    if not page.get_images(full=False):
+        return images_data
+
+    # A single pass over the page content lists every placement
+    for info in page.get_image_info(xrefs=True):
+        xref = info["xref"]
+        # Inline images have no xref and cannot be extracted
+        if xref == 0:
+            continue
+
+        x0, y0, x1, y1 = info["bbox"]
+        if x1 - x0 < 1 or y1 - y0 < 1:
+            continue
+
+        images_data.append(ImagePlacement(len(images_data), xref, x0, y0, x1, y1))
+
+    return images_data
+
+
+class PageRenderer:
+    """Renders pages on the render thread, from its own copy of the document"""
+
+    def __init__(self):
+        # PyMuPDF documents must not be shared between threads, so this object
+        # is only ever used from the render thread
+        self.doc_id = None
+        self.doc = None
+
+    def render(self, doc_id, pdf_path, page_num, zoom, images_data=None):
+        # The file is reopened whenever the user opens a document, even the
+        # same path again: it may have changed on disk
+        if doc_id != self.doc_id:
+            self.close()
+            self.doc = open_document(pdf_path)
+            self.doc_id = doc_id
+
+        page = self.doc[page_num]
+        if images_data is None:
+            images_data = list_page_images(page)
+
+        scale = zoom * PAGE_RENDER_SCALE
+        mat = fitz.Matrix(scale, scale)
+        pix = page.get_pixmap(matrix=mat, alpha=False)
+
+        return (
+            doc_id,
+            page_num,
+            zoom,
+            pix.samples,
+            pix.width,
+            pix.height,
+            pix.stride,
+            images_data,
+        )
+
+    def close(self):
+        if self.doc:
+            self.doc.close()
+        self.doc_id = None
+        self.doc = None
+
+
 class PDFImageExtractor(QMainWindow):
+    # Emitted from the worker threads with the finished futures
+    page_rendered = Signal(object)
+    image_saved = Signal(object)
+
     def __init__(self, initial_file=None):
         super().__init__()
         self.setWindowTitle("PDF Image Extractor")
         self.resize(1400, 900)
 
         self.pdf_doc = None
+        self.pdf_path = None
+        # Incremented each time a document is opened, to tell the results of
+        # background work apart from those of the previously opened one
+        self.doc_id = 0
         self.current_page = 0
         self.images_data = []
+        # Page shown on screen, which images_data belongs to: current_page
+        # already changes while the next page is being rendered
+        self.displayed_page = 0
         self.zoom_level = 1.0
-        self.preview_popup = None
+        self.preview_popup = ImagePreviewPopup(self)
         self.temp_files = []
+        self.thumb_buttons = []
+        self.thumb_cache = OrderedDict()
+        self.page_cache = OrderedDict()
+        self.page_cache_pixels = 0
+        self.displayed_key = None
+        self.page_images_cache = {}
+        self.page_sizes = {}
+        self.image_cache = OrderedDict()
+        self.preview_cache = OrderedDict()
+
+        # Extract All writes images from a pool of worker threads
+        self.extract_pool = ThreadPoolExecutor(max_workers=EXTRACT_WORKERS)
+        self.extract_pending = set()
+        self.extract_errors = []
+        self.extract_directory = None
+        # Queued, so that a save finishing before submit returns is only
+        # accounted for once the whole batch has been submitted
+        self.image_saved.connect(self.on_image_saved, Qt.QueuedConnection)
+
+        # Pages are rendered on a single background thread. PyMuPDF holds the
+        # GIL while rasterizing, so the UI still stalls for the duration of a
+        # render; the thread only lets navigation and zoom requests queue up
+        # and be coalesced, and stale renders be cancelled before they start
+        self.render_pool = ThreadPoolExecutor(max_workers=1)
+        self.renderer = PageRenderer()
+        self.render_future = None
+        # Queued, so that a render that finishes before render_future is
+        # assigned is only handled after the assignment
+        self.page_rendered.connect(self.on_page_rendered, Qt.QueuedConnection)
 
         self.setup_ui()
 
@@ -249,6 +442,12 @@ class PDFImageExtractor(QMainWindow):
 
         toolbar_layout.addStretch()
 
+        self.extract_progress = QProgressBar()
+        self.extract_progress.setMaximumWidth(120)
+        self.extract_progress.setMaximumHeight(16)
+        self.extract_progress.hide()
+        toolbar_layout.addWidget(self.extract_progress)
+
         self.status_label = QLabel("No PDF loaded")
         toolbar_layout.addWidget(self.status_label)
 
@@ -268,6 +467,7 @@ class PDFImageExtractor(QMainWindow):
         self.outline_tree = QTreeWidget()
         self.outline_tree.setHeaderHidden(True)
         self.outline_tree.itemClicked.connect(self.on_outline_clicked)
+        self.outline_tree.itemExpanded.connect(self.on_outline_expanded)
         self.left_tabs.addTab(self.outline_tree, "Outline")
 
         # Thumbnails tab
@@ -280,12 +480,30 @@ class PDFImageExtractor(QMainWindow):
         self.thumb_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         self.thumb_container = QWidget()
+        self.thumb_container.setStyleSheet("QPushButton { text-align: center; }")
         self.thumb_layout = QVBoxLayout(self.thumb_container)
         self.thumb_layout.setAlignment(Qt.AlignTop)
         self.thumb_scroll.setWidget(self.thumb_container)
 
+        # A single group dispatches clicks, using the page number as button id
+        self.thumb_group = QButtonGroup(self)
+        self.thumb_group.idClicked.connect(self.goto_page_num)
+
+        # Thumbnails are rendered lazily, when they become visible. Rendering is
+        # deferred so that the layout is up to date, and so that a fast wheel spin
+        # only renders the pages where scrolling stops, not every page it passes
+        self.thumb_render_timer = QTimer(self)
+        self.thumb_render_timer.setSingleShot(True)
+        self.thumb_render_timer.setInterval(THUMBNAIL_RENDER_DELAY)
+        self.thumb_render_timer.timeout.connect(self.render_visible_thumbnails)
+        self.thumb_scroll.verticalScrollBar().valueChanged.connect(
+            lambda value: self.thumb_render_timer.start()
+        )
+        self.thumb_scroll.viewport().installEventFilter(self)
+
         thumb_layout.addWidget(self.thumb_scroll)
-        self.left_tabs.addTab(thumb_widget, "Thumbnails")
+        self.thumb_tab_index = self.left_tabs.addTab(thumb_widget, "Thumbnails")
+        self.left_tabs.currentChanged.connect(self.on_left_tab_changed)
 
         left_layout.addWidget(self.left_tabs)
         left_widget.setMinimumWidth(220)
@@ -338,6 +556,11 @@ class PDFImageExtractor(QMainWindow):
 
         main_layout.addWidget(splitter)
 
+        # Rapid navigation or zoom changes only render the page once they settle
+        self.display_timer = QTimer(self)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.timeout.connect(self.display_page)
+
         # Keyboard shortcuts
         QShortcut(QKeySequence(Qt.Key_Left), self, self.prev_page)
         QShortcut(QKeySequence(Qt.Key_Right), self, self.next_page)
@@ -351,18 +574,34 @@ class PDFImageExtractor(QMainWindow):
 
     def open_pdf_file(self, file_path):
         try:
+            import_pdf_modules()
+
             if self.pdf_doc:
                 self.pdf_doc.close()
 
-            self.pdf_doc = fitz.open(file_path)
+            self.pdf_doc = open_document(file_path)
+            self.pdf_path = file_path
+            self.doc_id += 1
+            if self.render_future is not None:
+                self.render_future.cancel()
+                self.render_future = None
+            self.page_cache.clear()
+            self.page_cache_pixels = 0
+            self.displayed_key = None
+            self.page_images_cache.clear()
+            self.page_sizes.clear()
+            self.image_cache.clear()
+            self.preview_cache.clear()
             self.current_page = 0
             self.zoom_level = 1.0
 
             self.load_outline()
-            self.load_thumbnails()
-            self.display_page()
+            # Thumbnails are only laid out once their tab is shown
+            self.clear_thumbnails()
+            if self.left_tabs.currentIndex() == self.thumb_tab_index:
+                self.load_thumbnails()
 
-            # Apply fit after display
+            # Let the layout settle, then render once directly at the fit zoom
             QApplication.processEvents()
             self.zoom_fit()
 
@@ -372,11 +611,22 @@ class PDFImageExtractor(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open PDF: {str(e)}")
 
+    def page_size(self, page_num):
+        """Return the (width, height) of a page in PDF units"""
+        size = self.page_sizes.get(page_num)
+        if size is None:
+            rect = self.pdf_doc[page_num].rect
+            size = self.page_sizes[page_num] = (rect.width, rect.height)
+        return size
+
     def load_outline(self):
         self.outline_tree.clear()
 
         toc = self.pdf_doc.get_toc()
 
+        # Items are assembled detached from the tree, then inserted in one call
+        top_level_items = []
+
         if toc:
             parent_stack = [(None, 0)]
 
@@ -392,109 +642,223 @@ class PDFImageExtractor(QMainWindow):
                 if parent:
                     parent.addChild(item)
                 else:
-                    self.outline_tree.addTopLevelItem(item)
+                    top_level_items.append(item)
 
                 parent_stack.append((item, level))
+        elif len(self.pdf_doc) <= OUTLINE_PAGE_GROUP_SIZE:
+            top_level_items = self.create_page_items(0, len(self.pdf_doc))
         else:
-            for i in range(len(self.pdf_doc)):
-                item = QTreeWidgetItem([f"Page {i+1}"])
-                item.setData(0, Qt.UserRole, i)
-                self.outline_tree.addTopLevelItem(item)
-
-    def load_thumbnails(self):
-        # Clear existing thumbnails
+            # Long documents are listed by page ranges, filled in when expanded
+            for start in range(0, len(self.pdf_doc), OUTLINE_PAGE_GROUP_SIZE):
+                end = min(start + OUTLINE_PAGE_GROUP_SIZE, len(self.pdf_doc))
+                item = QTreeWidgetItem([f"Pages {start+1}–{end}"])
+                item.setData(0, Qt.UserRole, start)
+                item.setData(0, Qt.UserRole + 1, end)
+                item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+                top_level_items.append(item)
+
+        self.outline_tree.addTopLevelItems(top_level_items)
+
+    def create_page_items(self, start, end):
+        items = []
+        for i in range(start, end):
+            item = QTreeWidgetItem([f"Page {i+1}"])
+            item.setData(0, Qt.UserRole, i)
+            items.append(item)
+        return items
+
+    def on_outline_expanded(self, item):
+        end = item.data(0, Qt.UserRole + 1)
+        if end is not None and item.childCount() == 0:
+            start = item.data(0, Qt.UserRole)
+            item.addChildren(self.create_page_items(start, end))
+
+    def on_left_tab_changed(self, index):
+        if index == self.thumb_tab_index:
+            if self.pdf_doc and not self.thumb_buttons:
+                self.load_thumbnails()
+            self.thumb_render_timer.start()
+
+    def clear_thumbnails(self):
+        for thumb_btn in self.thumb_buttons:
+            self.thumb_group.removeButton(thumb_btn)
         while self.thumb_layout.count():
             child = self.thumb_layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
 
-        for i in range(len(self.pdf_doc)):
-            page = self.pdf_doc[i]
-            mat = fitz.Matrix(0.2, 0.2)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-
-            # Convert to QPixmap
-            img_data = pix.tobytes("ppm")
-            qimage = QImage(
-                img_data, pix.width, pix.height, pix.stride, QImage.Format_RGB888
-            )
-            pixmap = QPixmap.fromImage(qimage)
+        self.thumb_buttons = []
+        self.thumb_cache.clear()
 
-            # Create clickable thumbnail
-            thumb_btn = QPushButton()
-            thumb_btn.setIcon(pixmap)
-            thumb_btn.setIconSize(QSize(150, int(150 * pix.height / pix.width)))
-            thumb_btn.setText(f"Page {i+1}")
-            thumb_btn.setStyleSheet("text-align: center;")
-            thumb_btn.clicked.connect(lambda checked, page=i: self.goto_page_num(page))
+    def load_thumbnails(self):
+        self.clear_thumbnails()
 
+        icon_heights = []
+        for i in range(len(self.pdf_doc)):
+            width, height = self.page_size(i)
+            icon_heights.append(int(THUMBNAIL_WIDTH * height / width))
+
+        # Only create placeholders here: pages are rendered when scrolled into view.
+        # The container is detached meanwhile so that it is laid out once at the end.
+        self.thumb_scroll.takeWidget()
+        for i, icon_height in enumerate(icon_heights):
+            thumb_btn = QPushButton(f"Page {i+1}")
+            thumb_btn.setIconSize(QSize(THUMBNAIL_WIDTH, icon_height))
+            thumb_btn.setFixedHeight(icon_height + 12)
+            self.thumb_group.addButton(thumb_btn, i)
             self.thumb_layout.addWidget(thumb_btn)
+            self.thumb_buttons.append(thumb_btn)
+        self.thumb_scroll.setWidget(self.thumb_container)
+
+        self.thumb_render_timer.start()
+
+    def render_thumbnail(self, page_num):
+        """Return the thumbnail of a page, rendering it if not cached"""
+        pixmap = self.thumb_cache.get(page_num)
+        if pixmap is not None:
+            self.thumb_cache.move_to_end(page_num)
+            return pixmap
+
+        page = self.pdf_doc[page_num]
+        scale = THUMBNAIL_WIDTH / self.page_size(page_num)[0]
+        mat = fitz.Matrix(scale, scale)
+        pix = page.get_pixmap(matrix=mat, alpha=False)
+        qimage = QImage(
+            pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format_RGB888
+        )
+        pixmap = QPixmap.fromImage(qimage)
+
+        self.thumb_cache[page_num] = pixmap
+        if len(self.thumb_cache) > THUMBNAIL_CACHE_SIZE:
+            evicted, _ = self.thumb_cache.popitem(last=False)
+            self.thumb_buttons[evicted].setIcon(QIcon())
+
+        return pixmap
+
+    def render_visible_thumbnails(self):
+        if not self.pdf_doc or not self.thumb_buttons:
+            return
+        if not self.thumb_scroll.isVisible():
+            return
+
+        top = self.thumb_scroll.verticalScrollBar().value()
+        bottom = top + self.thumb_scroll.viewport().height()
+
+        for page_num, thumb_btn in enumerate(self.thumb_buttons):
+            geometry = thumb_btn.geometry()
+            if geometry.bottom() < top:
+                continue
+            if geometry.top() > bottom:
+                break
+            if thumb_btn.icon().isNull():
+                thumb_btn.setIcon(self.render_thumbnail(page_num))
+            else:
+                self.thumb_cache.move_to_end(page_num)
+
+    def eventFilter(self, obj, event):
+        if obj is self.thumb_scroll.viewport() and event.type() == QEvent.Resize:
+            # Only a taller viewport can reveal thumbnails that are not rendered yet
+            if event.size().height() > event.oldSize().height():
+                self.thumb_render_timer.start()
+        return super().eventFilter(obj, event)
 
     def on_outline_clicked(self, item):
         page_num = item.data(0, Qt.UserRole)
         if page_num is not None:
             self.current_page = page_num
-            self.display_page()
+            self.schedule_display()
 
     def display_page(self):
         if not self.pdf_doc:
             return
 
-        try:
-            page = self.pdf_doc[self.current_page]
+        # Nothing to do if that page is already shown at that zoom
+        key = (self.current_page, round(self.zoom_level, 3))
+        if key == self.displayed_key:
+            return
 
-            # Render page
-            zoom = self.zoom_level * 2.0
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
+        # Revisiting a page at the same zoom reuses the previous rendering
+        cached = self.page_cache.get(key)
+        if cached is not None:
+            self.page_cache.move_to_end(key)
+            self.show_page(key, *cached)
+            return
 
-            # Convert to QPixmap
-            img_data = pix.tobytes("ppm")
-            qimage = QImage(
-                img_data, pix.width, pix.height, pix.stride, QImage.Format_RGB888
-            )
-            pixmap = QPixmap.fromImage(qimage)
-
-            self.pdf_label.setPixmap(pixmap)
-            self.pdf_label.resize(pixmap.size())
-
-            # Extract images
-            self.images_data = []
-            image_list = page.get_images()
-
-            for idx, img_info in enumerate(image_list):
-                xref = img_info[0]
-                rects = page.get_image_rects(xref)
-
-                for rect_idx, rect in enumerate(rects):
-                    x0, y0, x1, y1 = rect.x0, rect.y0, rect.x1, rect.y1
-                    width = x1 - x0
-                    height = y1 - y0
-
-                    if width < 1 or height < 1:
-                        continue
-
-                    self.images_data.append(
-                        {
-                            "index": len(self.images_data),
-                            "xref": xref,
-                            "x0": x0,
-                            "y0": y0,
-                            "x1": x1,
-                            "y1": y1,
-                            "width": width,
-                            "height": height,
-                            "name": f"image_{xref}_{rect_idx}",
-                        }
-                    )
-
-            self.update_image_list()
-
-            # Update page entry
-            self.page_entry.setText(str(self.current_page + 1))
+        # Otherwise render off the UI thread; a queued render of a page that the
+        # user already navigated away from is dropped
+        if self.render_future is not None:
+            self.render_future.cancel()
+        self.render_future = self.render_pool.submit(
+            self.renderer.render,
+            self.doc_id,
+            self.pdf_path,
+            self.current_page,
+            self.zoom_level,
+            self.page_images_cache.get(self.current_page),
+        )
+        self.render_future.add_done_callback(self.page_rendered.emit)
 
+    def on_page_rendered(self, future):
+        """Receive a page rendered by the render thread (runs on the UI thread)"""
+        if future.cancelled():
+            return
+
+        try:
+            (
+                doc_id,
+                page_num,
+                zoom,
+                samples,
+                width,
+                height,
+                stride,
+                images_data,
+            ) = future.result()
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to display page: {str(e)}")
+            # Only the page the user last asked for is reported; render_future
+            # is reset when a document is opened
+            if future is self.render_future:
+                QMessageBox.critical(self, "Error", f"Failed to display page: {str(e)}")
+            return
+
+        # The document was closed or replaced while rendering
+        if doc_id != self.doc_id:
+            return
+
+        qimage = QImage(samples, width, height, stride, QImage.Format_RGB888)
+        pixmap = QPixmap.fromImage(qimage)
+
+        self.page_images_cache[page_num] = images_data
+        key = (page_num, round(zoom, 3))
+        self.cache_page(key, pixmap, images_data)
+
+        if key == (self.current_page, round(self.zoom_level, 3)):
+            self.show_page(key, pixmap, images_data)
+
+    def cache_page(self, key, pixmap, images_data):
+        """Keep a rendered page, evicting the oldest ones beyond the pixel budget"""
+        previous = self.page_cache.pop(key, None)
+        if previous is not None:
+            self.page_cache_pixels -= previous[0].width() * previous[0].height()
+        self.page_cache[key] = (pixmap, images_data)
+        self.page_cache_pixels += pixmap.width() * pixmap.height()
+        # The newest page is kept even when it alone exceeds the budget
+        while self.page_cache_pixels > PAGE_CACHE_PIXELS and len(self.page_cache) > 1:
+            old_pixmap, _ = self.page_cache.popitem(last=False)[1]
+            self.page_cache_pixels -= old_pixmap.width() * old_pixmap.height()
+
+    def show_page(self, key, pixmap, images_data):
+        self.displayed_key = key
+        self.displayed_page = key[0]
+        self.images_data = images_data
+
+        self.pdf_label.setPixmap(pixmap)
+        self.pdf_label.resize(pixmap.size())
+
+        self.update_image_list()
+
+        # Update page entry
+        self.page_entry.setText(str(self.current_page + 1))
 
     def update_image_list(self):
         self.image_list.clear()
@@ -504,30 +868,73 @@ class PDFImageExtractor(QMainWindow):
             return
 
         for img_data in self.images_data:
-            text = f"Image #{img_data['index']+1}  {int(img_data['width'])}×{int(img_data['height'])}"
+            text = f"Image #{img_data.index+1}  {int(img_data.width)}×{int(img_data.height)}"
             item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, img_data["index"])
+            item.setData(Qt.UserRole, img_data.index)
             self.image_list.addItem(item)
 
+    def extract_image(self, xref):
+        """Return the raw image stream of an xref, extracting it if not cached"""
+        base_image = self.image_cache.get(xref)
+        if base_image is not None:
+            self.image_cache.move_to_end(xref)
+            return base_image
+
+        # Only the encoded bytes are kept, which is far smaller than decoded pixels
+        base_image = self.pdf_doc.extract_image(xref)
+
+        self.image_cache[xref] = base_image
+        if len(self.image_cache) > IMAGE_CACHE_SIZE:
+            self.image_cache.popitem(last=False)
+
+        return base_image
+
+    def load_image(self, xref):
+        """Return the decoded image of an xref"""
+        return Image.open(io.BytesIO(self.extract_image(xref)["image"]))
+
+    def load_preview(self, xref):
+        """Return the preview-sized pixmap of an xref, creating it if not cached"""
+        pixmap = self.preview_cache.get(xref)
+        if pixmap is not None:
+            self.preview_cache.move_to_end(xref)
+            return pixmap
+
+        pil_image = self.load_image(xref)
+
+        img_width, img_height = pil_image.size
+        if img_width > PREVIEW_MAX_SIZE or img_height > PREVIEW_MAX_SIZE:
+            ratio = min(PREVIEW_MAX_SIZE / img_width, PREVIEW_MAX_SIZE / img_height)
+            new_width = int(img_width * ratio)
+            new_height = int(img_height * ratio)
+            # reducing_gap first shrinks by an integer factor, which is much
+            # cheaper than a full LANCZOS pass on large embedded images
+            pil_image = pil_image.resize(
+                (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0
+            )
+
+        # Convert PIL to QPixmap
+        img_byte_arr = io.BytesIO()
+        pil_image.save(img_byte_arr, format="PNG")
+        pixmap = QPixmap.fromImage(QImage.fromData(img_byte_arr.getvalue()))
+
+        self.preview_cache[xref] = pixmap
+        if len(self.preview_cache) > IMAGE_CACHE_SIZE:
+            self.preview_cache.popitem(last=False)
+
+        return pixmap
+
     def on_image_hover(self, item):
         index = item.data(Qt.UserRole)
         if index is None or index >= len(self.images_data):
             return
 
-        if self.preview_popup:
-            self.preview_popup.close()
-            self.preview_popup = None
-
         try:
             img_data = self.images_data[index]
-            xref = img_data["xref"]
-
-            base_image = self.pdf_doc.extract_image(xref)
-            image_bytes = base_image["image"]
-            pil_image = Image.open(io.BytesIO(image_bytes))
+            xref = img_data.xref
 
-            self.preview_popup = ImagePreviewPopup(
-                self, pil_image, f"Image #{img_data['index']+1}"
+            self.preview_popup.set_image(
+                self.load_preview(xref), f"Image #{img_data.index+1}"
             )
 
             # Position near cursor
@@ -548,12 +955,11 @@ class PDFImageExtractor(QMainWindow):
             self.preview_popup.show()
 
         except Exception as e:
+            self.preview_popup.hide()
             print(f"Error showing preview: {e}")
 
     def on_image_clicked(self, item):
-        if self.preview_popup:
-            self.preview_popup.close()
-            self.preview_popup = None
+        self.preview_popup.hide()
 
         index = item.data(Qt.UserRole)
         if index is None or index >= len(self.images_data):
@@ -563,21 +969,26 @@ class PDFImageExtractor(QMainWindow):
 
     def save_image(self, img_data):
         try:
-            xref = img_data["xref"]
-            base_image = self.pdf_doc.extract_image(xref)
-            image_bytes = base_image["image"]
-            pil_image = Image.open(io.BytesIO(image_bytes))
+            base_image = self.extract_image(img_data.xref)
+            ext = base_image["ext"]
 
-            default_name = f"page{self.current_page+1}_image{img_data['index']+1}.png"
+            default_name = f"page{self.displayed_page+1}_image{img_data.index+1}.{ext}"
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "Save Image",
                 default_name,
-                "PNG files (*.png);;JPEG files (*.jpg);;All files (*)",
+                f"Original format (*.{ext});;PNG files (*.png);;"
+                "JPEG files (*.jpg);;All files (*)",
             )
 
             if file_path:
-                pil_image.save(file_path)
+                target_ext = os.path.splitext(file_path)[1][1:].lower()
+                if JPEG_EXTENSIONS.get(target_ext, target_ext) == ext:
+                    # Same format as stored in the PDF: no need to re-encode
+                    with open(file_path, "wb") as f:
+                        f.write(base_image["image"])
+                else:
+                    self.load_image(img_data.xref).save(file_path)
                 QMessageBox.information(
                     self, "Success", f"Image saved to:\n{file_path}"
                 )
@@ -590,52 +1001,94 @@ class PDFImageExtractor(QMainWindow):
             QMessageBox.information(self, "Info", "No images found on this page.")
             return
 
+        if self.extract_pending:
+            return
+
         directory = QFileDialog.getExistingDirectory(
             self, "Select directory to save images"
         )
 
         if directory:
-            try:
-                saved_count = 0
-                saved_xrefs = set()
-
-                for img_data in self.images_data:
-                    xref = img_data["xref"]
-                    if xref in saved_xrefs:
-                        continue
-
-                    base_image = self.pdf_doc.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    pil_image = Image.open(io.BytesIO(image_bytes))
-
-                    filename = (
-                        f"page{self.current_page+1}_image{img_data['index']+1}.png"
-                    )
-                    file_path = os.path.join(directory, filename)
-                    pil_image.save(file_path)
-                    saved_count += 1
-                    saved_xrefs.add(xref)
-
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Extracted {saved_count} unique image(s) to:\n{directory}",
+            # Images placed several times on the page are only saved once
+            unique_images = {}
+            for img_data in self.images_data:
+                unique_images.setdefault(img_data.xref, img_data)
+
+            targets = [
+                (
+                    xref,
+                    os.path.join(
+                        directory,
+                        f"page{self.displayed_page+1}_image{img_data.index+1}",
+                    ),
                 )
+                for xref, img_data in unique_images.items()
+            ]
 
+            # PyMuPDF holds the GIL while extracting, so images are read here
+            # from the open document and only the file writes are threaded
+            try:
+                images = [
+                    (self.extract_image(xref), base_path) for xref, base_path in targets
+                ]
             except Exception as e:
                 QMessageBox.critical(
                     self, "Error", f"Failed to extract images: {str(e)}"
                 )
+                return
+
+            self.extract_directory = directory
+            self.extract_errors = []
+            self.extract_all_btn.setEnabled(False)
+            self.extract_progress.setRange(0, len(images))
+            self.extract_progress.setValue(0)
+            self.extract_progress.show()
+
+            for base_image, base_path in images:
+                future = self.extract_pool.submit(write_image, base_image, base_path)
+                self.extract_pending.add(future)
+                future.add_done_callback(self.image_saved.emit)
+
+    def on_image_saved(self, future):
+        """Account for one saved image (runs on the UI thread)"""
+        self.extract_pending.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            self.extract_errors.append(str(future.exception()))
+
+        self.extract_progress.setValue(self.extract_progress.value() + 1)
+        if self.extract_pending:
+            return
+
+        # Last image of the batch
+        self.extract_progress.hide()
+        self.extract_all_btn.setEnabled(True)
+        saved_count = self.extract_progress.maximum() - len(self.extract_errors)
+
+        if self.extract_errors:
+            self.status_label.setText("Extraction failed")
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Failed to extract images: {self.extract_errors[0]}",
+            )
+        else:
+            self.status_label.setText(f"Extracted {saved_count} image(s)")
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Extracted {saved_count} unique image(s) to:\n"
+                f"{self.extract_directory}",
+            )
 
     def prev_page(self):
         if self.pdf_doc and self.current_page > 0:
             self.current_page -= 1
-            self.display_page()
+            self.schedule_display()
 
     def next_page(self):
         if self.pdf_doc and self.current_page < len(self.pdf_doc) - 1:
             self.current_page += 1
-            self.display_page()
+            self.schedule_display()
 
     def goto_page(self):
         if not self.pdf_doc:
@@ -645,7 +1098,7 @@ class PDFImageExtractor(QMainWindow):
             page_num = int(self.page_entry.text()) - 1
             if 0 <= page_num < len(self.pdf_doc):
                 self.current_page = page_num
-                self.display_page()
+                self.schedule_display()
             else:
                 QMessageBox.warning(
                     self,
@@ -660,32 +1113,37 @@ class PDFImageExtractor(QMainWindow):
     def goto_page_num(self, page_num):
         if 0 <= page_num < len(self.pdf_doc):
             self.current_page = page_num
-            self.display_page()
+            self.schedule_display()
+
+    def schedule_display(self, delay=NAVIGATION_RENDER_DELAY):
+        """Display the current page once no other change follows within delay ms"""
+        self.page_entry.setText(str(self.current_page + 1))
+        self.display_timer.start(delay)
 
     def zoom_in(self):
         self.zoom_level = min(self.zoom_level * 1.25, 4.0)
         self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
-        self.display_page()
+        self.schedule_display(ZOOM_RENDER_DELAY)
 
     def zoom_out(self):
         self.zoom_level = max(self.zoom_level * 0.8, 0.25)
         self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
-        self.display_page()
+        self.schedule_display(ZOOM_RENDER_DELAY)
 
     def zoom_fit(self):
         if not self.pdf_doc:
             return
 
-        page = self.pdf_doc[self.current_page]
+        page_width, page_height = self.page_size(self.current_page)
         viewport_width = self.scroll_area.viewport().width()
         viewport_height = self.scroll_area.viewport().height()
 
         if viewport_width > 1 and viewport_height > 1:
-            scale_x = viewport_width / (page.rect.width * 2.0)
-            scale_y = viewport_height / (page.rect.height * 2.0)
+            scale_x = viewport_width / (page_width * PAGE_RENDER_SCALE)
+            scale_y = viewport_height / (page_height * PAGE_RENDER_SCALE)
             self.zoom_level = min(scale_x, scale_y, 1.0)
-            self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
-            self.display_page()
+        self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
+        self.display_page()
 
     def cleanup_temp_files(self):
         for temp_file in self.temp_files:
@@ -697,7 +1155,12 @@ class PDFImageExtractor(QMainWindow):
         self.temp_files.clear()
 
     def closeEvent(self, event):
+        self.extract_pool.shutdown(wait=True)
         self.cleanup_temp_files()
+        if self.render_future is not None:
+            self.render_future.cancel()
+        self.render_pool.submit(self.renderer.close)
+        self.render_pool.shutdown(wait=True)
         if self.pdf_doc:
             self.pdf_doc.close()
         event.accept()